@@ -4,7 +4,7 @@
 T180 (180nm) Process Node Layout Generation Module
 """
 
-from .layout_generator import LayoutGeneratorT180, generate_layout_from_json
+from .layout_generator import LayoutGeneratorT180, generate_layout_from_json, generate_layout_from_dict
 from .skill_generator import SkillGeneratorT180
 from .auto_filler import AutoFillerGeneratorT180
 from .layout_visualizer import visualize_layout_T180, visualize_layout_from_components_T180
@@ -12,6 +12,7 @@ from .layout_visualizer import visualize_layout_T180, visualize_layout_from_comp
 __all__ = [
     'LayoutGeneratorT180',
     'generate_layout_from_json',
+    'generate_layout_from_dict',
     'SkillGeneratorT180',
     'AutoFillerGeneratorT180',
     'visualize_layout_T180',
@@ -4,7 +4,7 @@
 T28 (28nm) Process Node Layout Generation Module
 """
 
-from .layout_generator import LayoutGeneratorT28, generate_layout_from_json
+from .layout_generator import LayoutGeneratorT28, generate_layout_from_json, generate_layout_from_dict
 from .skill_generator import SkillGeneratorT28
 from .auto_filler import AutoFillerGeneratorT28
 from .inner_pad_handler import InnerPadHandler
@@ -13,6 +13,7 @@ from .layout_visualizer import visualize_layout, visualize_layout_from_component
 __all__ = [
     'LayoutGeneratorT28',
     'generate_layout_from_json',
+    'generate_layout_from_dict',
     'SkillGeneratorT28',
     'AutoFillerGeneratorT28',
     'InnerPadHandler',
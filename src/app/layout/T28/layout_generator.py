@@ -171,11 +171,17 @@ class LayoutGeneratorT28:
 def generate_layout_from_json(json_file: str, output_file: str = "generated_layout.il"):
     """Generate 28nm layout from JSON file"""
     print(f"📖 Reading intent graph file: {json_file}")
-    print(f"🔧 Using process node: 28nm")
     
     with open(json_file, 'r', encoding='utf-8') as f:
         config = json.load(f)
     
+    return generate_layout_from_dict(config, output_file)
+
+
+def generate_layout_from_dict(config: dict, output_file: str = "generated_layout.il"):
+    """Generate 28nm layout from an already-parsed intent graph"""
+    print(f"🔧 Using process node: 28nm")
+    
     instances = config.get("instances", [])
     ring_config = config.get("ring_config", {})
     
@@ -238,7 +244,8 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
     print("✅ Configuration parameters set")
     
     # Convert relative positions
-    if any("position" in instance and "_" in str(instance["position"]) for instance in instances):
+    # Relative positions are strings like "top_3", skip str() on absolute ones
+    if any(isinstance(instance.get("position"), str) and "_" in instance["position"] for instance in instances):
         instances = generator.convert_relative_to_absolute(instances, ring_config)
     
     # Separate components
@@ -8,6 +8,7 @@ Layout Generator Package
 from .layout_generator_factory import (
     create_layout_generator,
     generate_layout_from_json,
+    generate_layout_from_dict,
     validate_layout_config
 )
 
@@ -43,6 +44,7 @@ __all__ = [
     # Factory functions
     'create_layout_generator',
     'generate_layout_from_json',
+    'generate_layout_from_dict',
     'validate_layout_config',
     # Process node generators
     'LayoutGeneratorT28',
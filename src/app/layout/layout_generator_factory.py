@@ -4,8 +4,8 @@
 Layout Generator Factory - Creates process node-specific generators
 """
 
-from .T28.layout_generator import LayoutGeneratorT28, generate_layout_from_json as generate_T28
-from .T180.layout_generator import LayoutGeneratorT180, generate_layout_from_json as generate_T180
+from .T28.layout_generator import LayoutGeneratorT28, generate_layout_from_json as generate_T28, generate_layout_from_dict as generate_dict_T28
+from .T180.layout_generator import LayoutGeneratorT180, generate_layout_from_json as generate_T180, generate_layout_from_dict as generate_dict_T180
 
 
 def create_layout_generator(process_node: str = "T28"):
@@ -37,6 +37,20 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
         return generate_T28(json_file, output_file)
 
 
+def generate_layout_from_dict(config: dict, output_file: str = "generated_layout.il", process_node: str = "T28"):
+    """Generate layout from an already-parsed intent graph using process node-specific generator
+    
+    Args:
+        config: Intent graph dictionary (same structure as the JSON file)
+        output_file: Path to output SKILL file
+        process_node: Process node to use ("T28" or "T180", default: "T28")
+    """
+    if process_node == "T180":
+        return generate_dict_T180(config, output_file)
+    else:
+        return generate_dict_T28(config, output_file)
+
+
 def validate_layout_config(json_file: str, process_node: str = "T28") -> dict:
     """Validate intent graph file
     
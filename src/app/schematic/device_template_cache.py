@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Device Template Cache - Parses device template JSON files once per file version
+"""
+
+import os
+from functools import lru_cache
+from typing import Any, Dict
+
+from src.app.utils.json_utils import parse_json_bytes
+
+
+@lru_cache(maxsize=4)
+def _load_template(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Read and parse a device template file in one shot
+    
+    Args:
+        path: Template file path
+        mtime_ns: File modification time, only used as part of the cache key
+        size: File size, only used as part of the cache key
+    """
+    with open(path, 'rb') as f:
+        return parse_json_bytes(f.read())
+
+
+def get_device_templates(path) -> Dict[str, Any]:
+    """Get parsed device template data, re-reading the file only when it changes
+    
+    Args:
+        path: Template file path
+    
+    Returns:
+        Parsed template data (shared between callers, do not modify)
+    """
+    path = os.fspath(path)
+    st = os.stat(path)
+    return _load_template(path, st.st_mtime_ns, st.st_size)
@@ -15,6 +15,7 @@ from typing import Dict, Any
 # Import device template parser from the correct location (28nm)
 from src.scripts.devices.IO_device_info_T28_parser import DeviceTemplate, DeviceTemplateManager
 from src.app.intent_graph.json_validator import validate_config, convert_config_to_list, get_config_statistics
+from src.app.schematic.device_template_cache import get_device_templates
 
 class SchematicGenerator:
     def __init__(self, template_manager):
@@ -717,7 +718,7 @@ def load_templates_from_json(json_file=None):
         )
     
     template_manager = DeviceTemplateManager()
-    template_manager.load_templates_from_json(json_file)
+    template_manager.load_templates_from_dict(get_device_templates(json_file))
     return template_manager
 
 def generate_multi_device_schematic(config_list, output_file="multi_device_schematic.il", voltage_config=None, clockwise=False):
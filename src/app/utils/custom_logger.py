@@ -75,46 +75,58 @@ class MinimalOutputLogger(AgentLogger):
     YELLOW = '\033[93m'   # Step timing
     RESET = '\033[0m'
     
+    # Lines containing any of these belong to code execution blocks and are hidden
+    _HIDDEN_MARKERS = (
+        "─ Executing parsed code:",
+        "──────────────────",
+        "Code:",
+        "print(",
+        "final_answer(",
+        "return "
+    )
+    
+    # (marker, color) checked in order; the first match is shown with that color
+    _SHOWN_MARKERS = (
+        ("Thought:", CYAN),
+        ("Final answer:", GREEN),
+        ("[Step ", YELLOW),
+        ("Observation:", ""),  # No color
+    )
+    
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # ANSI colors are only useful on a terminal; skip them when output is redirected
+        self._use_color = bool(getattr(sys.stdout, "isatty", None) and sys.stdout.isatty())
+        # Last message and its formatted output (None if hidden), replayed on exact repeats
+        self._last_in: Optional[str] = None
+        self._last_out: Optional[str] = None
+    
     def log(self, log: str, level: str = "info", **kwargs: Any):
         """Only show Thought and Final answer with colors"""
         
         # Convert to string for checking
         log_str = str(log)
         
-        # Skip code execution blocks entirely
-        if any(marker in log_str for marker in [
-            "─ Executing parsed code:",
-            "──────────────────",
-            "Code:",
-            "print(",
-            "final_answer(",
-            "return "
-        ]):
-            return
-        
-        # Determine if we should show this content and what color
-        should_show = False
-        color = ""
+        if log_str != self._last_in:
+            self._last_in = log_str
+            self._last_out = self._format(log_str)
         
-        if "Thought:" in log_str:
-            should_show = True
-            color = self.CYAN
-        elif "Final answer:" in log_str:
-            should_show = True
-            color = self.GREEN
-        elif "[Step " in log_str:
-            should_show = True
-            color = self.YELLOW
-        elif "Observation:" in log_str:
-            should_show = True
-            color = ""  # No color
+        if self._last_out is not None:
+            print(self._last_out)
+    
+    def _format(self, log_str: str) -> Optional[str]:
+        """Return the colored line to print, or None if the message is hidden"""
+        # Skip code execution blocks entirely
+        if any(marker in log_str for marker in self._HIDDEN_MARKERS):
+            return None
         
-        if should_show:
-            # Apply color by printing directly
-            if color:
-                print(f"{color}{log_str}{self.RESET}")
-            else:
-                print(log_str)
+        # Show only known content types, with the matching color
+        for marker, color in self._SHOWN_MARKERS:
+            if marker in log_str:
+                if color and self._use_color:
+                    return f"{color}{log_str}{self.RESET}"
+                return log_str
+        return None
 
 
 class SilentLogger(AgentLogger):
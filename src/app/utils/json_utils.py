@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON backend selection shared by the intent graph and device template loaders
+
+Prefers a SIMD / C-accelerated parser when available and falls back to stdlib json.
+"""
+
+import json
+import threading
+from typing import Any
+
+try:
+    import simdjson
+
+    # simdjson parsers reuse their internal buffers, keep one per thread
+    _simdjson_local = threading.local()
+
+    def parse_json_bytes(data: bytes) -> Any:
+        """Parse JSON from the raw bytes of a file"""
+        parser = getattr(_simdjson_local, "parser", None)
+        if parser is None:
+            parser = _simdjson_local.parser = simdjson.Parser()
+        return parser.parse(data, recursive=True)
+
+    JSON_DECODE_ERRORS = (json.JSONDecodeError, ValueError)
+except ImportError:
+    try:
+        import orjson as _fast_json
+        JSON_DECODE_ERRORS = (json.JSONDecodeError, _fast_json.JSONDecodeError)
+    except ImportError:
+        try:
+            import ujson as _fast_json
+            JSON_DECODE_ERRORS = (json.JSONDecodeError, getattr(_fast_json, "JSONDecodeError", ValueError))
+        except ImportError:
+            _fast_json = json
+            JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+    parse_json_bytes = _fast_json.loads
+
+
+__all__ = ['parse_json_bytes', 'JSON_DECODE_ERRORS']
@@ -1,25 +1,53 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import os
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 from .config_utils import load_instructions_from_file
 from src.tools.user_profile_tool import get_profile_path
 
 project_root = Path(__file__).parent.parent.parent.parent
 
+# Built prompt, keyed on the source files and their modification times and sizes
+_cache: Dict[Tuple, str] = {}
+
+
+def _file_version(path: Path) -> Optional[Tuple[int, int]]:
+    """Return the file's (mtime_ns, size), or None if it cannot be stat'ed"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def load_system_prompt_with_profile() -> str:
     """Load system prompt and append user profile if exists"""
     # Load system prompt from the correct path
     system_prompt_path = project_root / "Knowledge_Base" / "01_CORE" / "KB_Agent" / "system_prompt.md"
+    profile_path = get_profile_path()
+    
+    # Reuse the previous prompt while neither file has changed
+    key = (str(system_prompt_path), _file_version(system_prompt_path),
+           str(profile_path), _file_version(profile_path))
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+    
     base_prompt = load_instructions_from_file(str(system_prompt_path))
     
     # Load user profile (will show warning if not found)
-    profile_path = get_profile_path()
     user_profile = load_instructions_from_file(str(profile_path))
     
     if user_profile:
-        return f"{base_prompt}\n\n---\n\n## User Profile\n\n{user_profile}"
-    return base_prompt
+        prompt = f"{base_prompt}\n\n---\n\n## User Profile\n\n{user_profile}"
+    else:
+        prompt = base_prompt
+    
+    _cache.clear()
+    _cache[key] = prompt
+    return prompt
 
 
 if __name__ == "__main__":
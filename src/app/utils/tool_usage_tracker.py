@@ -6,7 +6,10 @@ Tool Usage Tracker - Tool usage statistics
 Track tool usage, success rate, execution time and other metrics to help Agent self-optimize.
 """
 
+import atexit
+import heapq
 import json
+import os
 import time
 from pathlib import Path
 from datetime import datetime
@@ -17,9 +20,40 @@ from collections import defaultdict
 class ToolUsageTracker:
     """Tool usage tracker"""
     
+    # One tracker per stats file, so constructing it again doesn't re-read the file
+    _instances: Dict[str, "ToolUsageTracker"] = {}
+    
+    # Pass as stats_file to keep statistics in memory only (nothing is read or written)
+    MEMORY = ":memory:"
+    
+    # Batched write thresholds
+    FLUSH_EVERY_CALLS = 32
+    FLUSH_INTERVAL = 1.0
+    
+    def __new__(cls, stats_file: str = "output/logs/tool_usage_stats.json"):
+        if stats_file == cls.MEMORY:
+            # Every in-memory tracker is independent
+            instance = super().__new__(cls)
+            instance._initialized = False
+            return instance
+        key = os.path.abspath(stats_file)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._initialized = False
+            cls._instances[key] = instance
+        return instance
+    
     def __init__(self, stats_file: str = "output/logs/tool_usage_stats.json"):
-        self.stats_file = Path(stats_file)
-        self.stats_file.parent.mkdir(parents=True, exist_ok=True)
+        if self._initialized:
+            return
+        self._initialized = True
+        
+        if stats_file == self.MEMORY:
+            self.stats_file = None
+        else:
+            self.stats_file = Path(stats_file)
+            self.stats_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Current session statistics (in-memory)
         self.session_stats = defaultdict(lambda: {
@@ -32,12 +66,18 @@ class ToolUsageTracker:
             "error_messages": []
         })
         
+        # Writes are batched: flush after FLUSH_EVERY_CALLS updates or FLUSH_INTERVAL seconds
+        self._pending_updates = 0
+        self._last_flush = time.monotonic()
+        if self.stats_file is not None:
+            atexit.register(self._flush)
+        
         # Load historical statistics
         self.load_stats()
     
     def load_stats(self):
         """Load historical statistics data"""
-        if self.stats_file.exists():
+        if self.stats_file is not None and self.stats_file.exists():
             try:
                 with open(self.stats_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
@@ -49,6 +89,9 @@ class ToolUsageTracker:
     
     def save_stats(self):
         """Save statistics data to file"""
+        if self.stats_file is None:
+            self._pending_updates = 0
+            return
         try:
             stats_data = {
                 "last_updated": datetime.now().isoformat(),
@@ -57,9 +100,22 @@ class ToolUsageTracker:
             
             with open(self.stats_file, 'w', encoding='utf-8') as f:
                 json.dump(stats_data, f, indent=2, ensure_ascii=False)
+            self._pending_updates = 0
+            self._last_flush = time.monotonic()
         except Exception as e:
             print(f"Warning: Failed to save tool stats: {e}")
     
+    def _maybe_flush(self):
+        """Save statistics once enough updates or time have accumulated"""
+        if (self._pending_updates >= self.FLUSH_EVERY_CALLS or
+                time.monotonic() - self._last_flush > self.FLUSH_INTERVAL):
+            self.save_stats()
+    
+    def _flush(self):
+        """Save statistics if there are unsaved updates (registered with atexit)"""
+        if self._pending_updates:
+            self.save_stats()
+    
     def track_call(self, tool_name: str, success: bool, execution_time: float, 
                     error_msg: Optional[str] = None):
         """
@@ -90,9 +146,9 @@ class ToolUsageTracker:
         stats["avg_time"] = stats["total_time"] / stats["total_calls"]
         stats["last_used"] = datetime.now().isoformat()
         
-        # Periodically save (save every 5 calls)
-        if stats["total_calls"] % 5 == 0:
-            self.save_stats()
+        # Batch writes instead of rewriting the file on every call
+        self._pending_updates += 1
+        self._maybe_flush()
     
     def get_tool_stats(self, tool_name: str) -> Dict[str, Any]:
         """Get statistics for specific tool"""
@@ -143,13 +199,13 @@ class ToolUsageTracker:
                 "avg_time": stats["avg_time"]
             })
         
-        # Sort
+        # Select the top N without sorting the whole list (same order as a stable sort)
         if by == "calls":
-            tools_list.sort(key=lambda x: x["calls"], reverse=True)
+            return heapq.nlargest(n, tools_list, key=lambda x: x["calls"])
         elif by == "success_rate":
-            tools_list.sort(key=lambda x: x["success_rate"], reverse=True)
+            return heapq.nlargest(n, tools_list, key=lambda x: x["success_rate"])
         elif by == "avg_time":
-            tools_list.sort(key=lambda x: x["avg_time"])
+            return heapq.nsmallest(n, tools_list, key=lambda x: x["avg_time"])
         
         return tools_list[:n]
     
@@ -184,9 +240,11 @@ class ToolUsageTracker:
         report.append("")
         
         # Overall statistics
-        total_calls = sum(s["total_calls"] for s in self.session_stats.values())
-        total_success = sum(s["successful_calls"] for s in self.session_stats.values())
-        total_failed = sum(s["failed_calls"] for s in self.session_stats.values())
+        total_calls = total_success = total_failed = 0
+        for s in self.session_stats.values():
+            total_calls += s["total_calls"]
+            total_success += s["successful_calls"]
+            total_failed += s["failed_calls"]
         
         report.append(f"Total Tools Used: {len(self.session_stats)}")
         report.append(f"Total Calls: {total_calls}")
@@ -244,7 +302,7 @@ def track_tool_execution(tool_name: str):
     def decorator(func):
         def wrapper(*args, **kwargs):
             tracker = get_tracker()
-            start_time = time.time()
+            start_time = time.monotonic()
             success = False
             error_msg = None
             
@@ -256,7 +314,7 @@ def track_tool_execution(tool_name: str):
                 error_msg = str(e)
                 raise
             finally:
-                execution_time = time.time() - start_time
+                execution_time = time.monotonic() - start_time
                 tracker.track_call(tool_name, success, execution_time, error_msg)
         
         return wrapper
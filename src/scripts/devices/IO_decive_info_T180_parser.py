@@ -411,6 +411,10 @@ class DeviceTemplateManager:
         with open(file_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
+        self.load_templates_from_dict(data)
+    
+    def load_templates_from_dict(self, data):
+        """Load templates from already-parsed template data"""
         # Load templates
         templates_dict = data.get('templates', {})
         for name, template_data in templates_dict.items():
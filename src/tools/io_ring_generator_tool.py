@@ -1,18 +1,188 @@
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import os
 import sys
-import json
+import itertools
+from collections import OrderedDict
+import threading
 from smolagents import tool
 
 from src.app.schematic.schematic_generator_T28 import generate_multi_device_schematic as generate_multi_device_schematic_28nm
 from src.app.schematic.schematic_generator_T180 import generate_multi_device_schematic as generate_multi_device_schematic_180nm
 from src.app.intent_graph.json_validator import validate_config, convert_config_to_list, get_config_statistics
-from src.app.layout.layout_generator_factory import generate_layout_from_json, create_layout_generator
+from src.app.layout.layout_generator_factory import generate_layout_from_dict, create_layout_generator
 from src.app.layout.T28.layout_visualizer import visualize_layout, visualize_layout_from_components
 from src.app.layout.T180.layout_visualizer import visualize_layout_T180
 from src.app.layout.device_classifier import DeviceClassifier, _normalize_process_node
 from src.app.layout.process_node_config import get_process_node_config, get_template_file_paths, list_supported_process_nodes
+from src.app.utils.json_utils import parse_json_bytes, JSON_DECODE_ERRORS
+
+
+# Parsed intent graphs keyed by absolute path -> [mtime_ns, size, config, validation],
+# reused while mtime and size are unchanged. validation is None until the file version
+# has passed validate_config, then (statistics, normalized config), so it is evicted
+# together with the parsed graph.
+# Bounded (least recently used evicted first): each session step writes a new graph file.
+_CONFIG_CACHE: "OrderedDict[str, List[Any]]" = OrderedDict()
+_CONFIG_CACHE_SIZE = 8
+
+
+def _config_cache_entry(path) -> List[Any]:
+    """Return the cache entry for the current version of a JSON file, parsing it on a miss"""
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+    entry = _CONFIG_CACHE.get(abs_path)
+    if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+        with open(abs_path, 'rb') as f:
+            config = parse_json_bytes(f.read())
+        entry = [stat.st_mtime_ns, stat.st_size, config, None]
+        _CONFIG_CACHE[abs_path] = entry
+    _CONFIG_CACHE.move_to_end(abs_path)
+    while len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+        _CONFIG_CACHE.popitem(last=False)
+    return entry
+
+
+def _load_json(path) -> Any:
+    """Read a JSON file in one shot and parse it from bytes
+    
+    Tools are usually chained on the same intent graph, so the parsed result is
+    cached per file. Callers get their own top-level dict and ring_config, so
+    merging defaults into them doesn't leak into the cache; instances are shared
+    and must be treated as read-only.
+    """
+    return _copy_config(_config_cache_entry(path)[2])
+
+
+def _copy_config(config: Any) -> Any:
+    """Copy the top-level dict and ring_config of a cached intent graph"""
+    if isinstance(config, dict):
+        config = dict(config)
+        if isinstance(config.get("ring_config"), dict):
+            config["ring_config"] = dict(config["ring_config"])
+    return config
+
+
+def _validate_cached(path) -> Tuple[bool, Optional[Dict[str, Any]], Any]:
+    """Load and validate an intent graph file, reusing the result while the file is unchanged
+    
+    Only successful validations are cached, so validate_config prints the reasons
+    for an invalid file every time it is checked.
+    
+    Returns:
+        Tuple of (is_valid, statistics or None, config as normalized by validation)
+    """
+    entry = _config_cache_entry(path)
+    if entry[3] is None:
+        config = _copy_config(entry[2])
+        if not validate_config(config):
+            return False, None, config
+        entry[3] = (get_config_statistics(config), config)
+    stats, config = entry[3]
+    return True, stats, _copy_config(config)
+
+
+# pyplot keeps global figure state, so renders from concurrent tool calls must not interleave
+_VIS_LOCK = threading.Lock()
+
+
+def _render_visualization(visualizer, *args):
+    """Run a pyplot-based visualizer while holding the visualization lock"""
+    with _VIS_LOCK:
+        return visualizer(*args)
+
+
+# ring_config keys filled from the layout generator defaults when missing
+_RING_CONFIG_DEFAULT_KEYS = ("pad_width", "pad_height", "corner_size", "pad_spacing", "library_name", "view_name")
+
+
+@lru_cache(maxsize=None)
+def _layout_defaults(process_node: str) -> Dict[str, Any]:
+    """Default configuration of a process node's layout generator (built once per node)"""
+    return dict(create_layout_generator(process_node).config)
+
+
+def _create_configured_generator(process_node: str, ring_config: Dict[str, Any]):
+    """Create a layout generator for process_node configured with ring_config"""
+    generator = create_layout_generator(process_node)
+    generator.set_config(ring_config)
+    return generator
+
+
+def _ensure_dir(path: str) -> None:
+    """Create a directory (and parents) if it is missing"""
+    if path and not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+
+
+def _ensure_ext(path: str, ext: str, accepted_exts: frozenset) -> str:
+    """Return path unchanged if its extension is accepted, otherwise with ext instead"""
+    root, suffix = os.path.splitext(path)
+    return path if suffix in accepted_exts else root + ext
+
+
+def _sibling_path(path: str, suffix: str) -> str:
+    """Return '<dir>/<stem><suffix>' next to path"""
+    return os.path.splitext(path)[0] + suffix
+
+
+# Accepted file extensions (set lookup instead of lowercasing each suffix)
+_JSON_EXTS = frozenset({".json", ".JSON"})
+_IL_EXTS = frozenset({".il", ".IL"})
+_PNG_EXTS = frozenset({".png", ".PNG"})
+
+
+# Integer codes for instance "type" values, checked once per instance
+_TYPE_OTHER, _TYPE_INNER_PAD, _TYPE_PAD, _TYPE_CORNER, _TYPE_FILLER, _TYPE_SEPARATOR = range(6)
+_TYPE_CODE = {
+    "inner_pad": _TYPE_INNER_PAD,
+    "pad": _TYPE_PAD,
+    "corner": _TYPE_CORNER,
+    "filler": _TYPE_FILLER,
+    "separator": _TYPE_SEPARATOR,
+}
+
+
+# Device names repeat heavily across instances, so memoize the classifier lookups
+_is_filler = lru_cache(maxsize=256)(DeviceClassifier.is_filler_device)
+_is_separator = lru_cache(maxsize=256)(DeviceClassifier.is_separator_device)
+
+
+# Directories searched (in order) for device template files
+_TEMPLATE_SEARCH_DIRS = (
+    Path("src/app/schematic"),
+    Path("src/schematic"),
+    Path("."),
+    Path("src/scripts/devices"),
+)
+
+# Parser output file checked after the configured template names
+_DEVICE_INFO_FILES = {
+    "T28": "IO_device_info_T28.json",
+    "T180": "IO_device_info_T180.json",
+}
+
+
+@lru_cache(maxsize=None)
+def _find_template_file(process_node: str) -> Optional[Path]:
+    """Return the first existing device template file for a process node
+    
+    Templates don't move between tool calls, so the lookup is cached.
+    Call _find_template_file.cache_clear() to force a rescan.
+    """
+    template_file_names = list(get_template_file_paths(process_node))
+    if process_node in _DEVICE_INFO_FILES:
+        template_file_names.append(_DEVICE_INFO_FILES[process_node])
+    
+    for template_name in template_file_names:
+        for search_dir in _TEMPLATE_SEARCH_DIRS:
+            path = search_dir / template_name
+            if path.exists():
+                return path
+    return None
+
 
 @tool
 def generate_io_ring_schematic(
@@ -42,12 +212,9 @@ def generate_io_ring_schematic(
         - "T180": 180nm process node (uses tpd018bcdnv5 library)
     """
     try:
-        # Check if intent graph file exists
-        config_path = Path(config_file_path)
-        
         # Check file extension
-        if config_path.suffix.lower() != '.json':
-            return f"❌ Error: File {config_path} is not a valid JSON file"
+        if os.path.splitext(config_file_path)[1] not in _JSON_EXTS:
+            return f"❌ Error: File {config_file_path} is not a valid JSON file"
         
         # Validate process node
         supported_nodes = list_supported_process_nodes()
@@ -58,42 +225,12 @@ def generate_io_ring_schematic(
         node_config = get_process_node_config(process_node)
         
         # Check if template file exists (try multiple locations and filenames based on process node)
-        template_file = None
         template_file_names = get_template_file_paths(process_node)
-        
-        # Build possible paths for each template file name
-        possible_paths = []
-        for template_name in template_file_names:
-            possible_paths.extend([
-                Path("src/app/schematic") / template_name,
-                Path("src/schematic") / template_name,
-                Path("device_templates.json") if template_name == "device_templates.json" else Path(template_name),
-                Path("src/scripts/devices") / template_name,
-            ])
-        
-        # For 28nm, also check for IO_device_info_T28.json
-        if process_node == "T28":
-            possible_paths.extend([
-                Path("src/app/schematic") / "IO_device_info_T28.json",
-            Path("src/schematic") / "IO_device_info_T28.json",
-                Path("IO_device_info_T28.json"),
-                Path("src/scripts/devices") / "IO_device_info_T28.json",
-            ])
-        # For 180nm, also check for IO_device_info_T180.json
-        elif process_node == "T180":
-            possible_paths.extend([
-                Path("src/app/schematic") / "IO_device_info_T180.json",
-                Path("src/schematic") / "IO_device_info_T180.json",
-                Path("IO_device_info_T180.json"),
-                Path("src/scripts/devices") / "IO_device_info_T180.json",
-            ])
-        
-        for path in possible_paths:
-            if path.exists():
-                template_file = path
-                break
+        template_file = _find_template_file(process_node)
         
         if template_file is None:
+            # Don't remember the miss, the template may be generated before the next call
+            _find_template_file.cache_clear()
             expected_files = ", ".join(template_file_names)
             return f"❌ Error: device template file not found for {process_node} process node.\n" \
                    f"Expected files: {expected_files}\n" \
@@ -106,9 +243,8 @@ def generate_io_ring_schematic(
         
         # Load configuration
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-        except json.JSONDecodeError as e:
+            config = _load_json(config_file_path)
+        except JSON_DECODE_ERRORS as e:
             return f"❌ Error: JSON format error {e}"
         except Exception as e:
             return f"❌ Error: Failed to load intent graph file {e}"
@@ -119,19 +255,18 @@ def generate_io_ring_schematic(
         # Process output file path
         if output_file_path is None:
             # Default output to output directory
-            output_dir = Path("output")
-            output_dir.mkdir(exist_ok=True)
-            output_path = output_dir / f"{config_path.stem}_generated.il"
+            _ensure_dir("output")
+            config_stem = os.path.splitext(os.path.basename(config_file_path))[0]
+            output_path = os.path.join("output", f"{config_stem}_generated.il")
         else:
             # Use user-specified output path
-            output_path = Path(output_file_path)
+            output_path = output_file_path
             
             # Ensure output directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(os.path.dirname(output_path))
             
             # If user didn't specify file extension, automatically add .il
-            if output_path.suffix.lower() != '.il':
-                output_path = output_path.with_suffix('.il')
+            output_path = _ensure_ext(output_path, '.il', _IL_EXTS)
         
         # Check if process_node is specified in config (override parameter)
         if isinstance(config, dict) and "ring_config" in config:
@@ -155,28 +290,30 @@ def generate_io_ring_schematic(
         try:
             # Select appropriate generator based on process node
             if process_node == "T28":
-                generate_multi_device_schematic_28nm(config_list, str(output_path))
+                generate_multi_device_schematic_28nm(config_list, output_path)
             elif process_node == "T180":
-                generate_multi_device_schematic_180nm(config_list, str(output_path))
+                generate_multi_device_schematic_180nm(config_list, output_path)
             else:
                 supported_nodes = list_supported_process_nodes()
                 return f"❌ Error: Unsupported process node '{process_node}'. Supported nodes: {', '.join(supported_nodes)}"
             
-            # Get statistics from config_list (filter out ring_config items)
-            device_instances = [item for item in config_list if isinstance(item, dict) and 'device' in item]
-            device_count = len(device_instances)
+            # Get statistics from config_list in one pass (filter out ring_config items)
+            device_count = 0
             device_types = set()
-            for item in device_instances:
-                if 'device' in item:
+            for item in config_list:
+                if isinstance(item, dict) and 'device' in item:
+                    device_count += 1
                     device_types.add(item['device'])
             
-            result = f"✅ Successfully generated schematic file: {output_path}\n"
-            result += f"📊 Statistics:\n"
-            result += f"  - Device instance count: {device_count}\n"
+            lines = [
+                f"✅ Successfully generated schematic file: {output_path}",
+                "📊 Statistics:",
+                f"  - Device instance count: {device_count}",
+            ]
             if device_types:
-                result += f"  - Device types used: {', '.join(sorted(device_types))}\n"
+                lines.append(f"  - Device types used: {', '.join(sorted(device_types))}")
             
-            return result
+            return "\n".join(lines) + "\n"
             
         except Exception as e:
             return f"❌ Failed to generate schematic: {e}"
@@ -213,19 +350,17 @@ def generate_io_ring_layout(
     """
     try:
         # Check if intent graph file exists
-        config_path = Path(config_file_path)
-        if not config_path.exists():
+        if not os.path.isfile(config_file_path):
             return f"❌ Error: Intent graph file {config_file_path} does not exist"
         
         # Check file extension
-        if config_path.suffix.lower() != '.json':
-            return f"❌ Error: File {config_path} is not a valid JSON file"
+        if os.path.splitext(config_file_path)[1] not in _JSON_EXTS:
+            return f"❌ Error: File {config_file_path} is not a valid JSON file"
         
         # Load configuration
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-        except json.JSONDecodeError as e:
+            config = _load_json(config_file_path)
+        except JSON_DECODE_ERRORS as e:
             return f"❌ Error: JSON format error {e}"
         except Exception as e:
             return f"❌ Error: Failed to load intent graph file {e}"
@@ -233,17 +368,16 @@ def generate_io_ring_layout(
         # Process output file path
         if output_file_path is None:
             # Default output to output directory
-            output_dir = Path("output")
-            output_dir.mkdir(exist_ok=True)
-            output_path = output_dir / f"{config_path.stem}_layout.il"
+            _ensure_dir("output")
+            config_stem = os.path.splitext(os.path.basename(config_file_path))[0]
+            output_path = os.path.join("output", f"{config_stem}_layout.il")
         else:
             # Use user-specified output path
-            output_path = Path(output_file_path)
+            output_path = output_file_path
             # Ensure output directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(os.path.dirname(output_path))
             # If user didn't specify file extension, automatically add .il
-            if output_path.suffix.lower() != '.il':
-                output_path = output_path.with_suffix('.il')
+            output_path = _ensure_ext(output_path, '.il', _IL_EXTS)
         
         # Validate process node
         supported_nodes = list_supported_process_nodes()
@@ -253,22 +387,14 @@ def generate_io_ring_layout(
         # Generate layout with process node configuration
         # Library name, cell name, and view name are read from config or use defaults
         try:
-            result_file = generate_layout_from_json(str(config_path), str(output_path), process_node)
-            
-            # Automatically generate visualization (use process-node-specific visualizer)
-            vis_output_path = None
-            try:
-                vis_output_path = output_path.parent / f"{output_path.stem}_visualization.png"
-                if process_node == "T180":
-                    visualize_layout_T180(str(output_path), str(vis_output_path))
-                else:
-                    visualize_layout(str(output_path), str(vis_output_path))
-            except Exception as vis_e:
-                # Visualization is optional, don't fail if it doesn't work
-                pass
+            # The generator also renders <stem>_visualization.png next to the layout with pyplot
+            result_file = _render_visualization(generate_layout_from_dict, config, output_path, process_node)
+            if result_file is None:
+                return f"❌ Failed to generate layout: layout rule validation failed for {config_file_path}"
             
             # Return success message with visualization info if generated
-            if vis_output_path and vis_output_path.exists():
+            vis_output_path = _sibling_path(output_path, "_visualization.png")
+            if os.path.exists(vis_output_path):
                 return f"✅ Successfully generated layout file: {output_path}\n" \
                        f"📊 Layout visualization generated: {vis_output_path}\n" \
                        f"💡 Tip: Review the visualization image to verify the layout arrangement."
@@ -279,6 +405,26 @@ def generate_io_ring_layout(
     except Exception as e:
         return f"❌ Error occurred while generating IO ring layout: {e}"
 
+def _inspect_intent_file(json_file: os.DirEntry) -> Optional[Dict[str, Any]]:
+    """Return summary info for an intent graph file, or None if it isn't one"""
+    try:
+        with open(json_file.path, 'rb') as f:
+            data = f.read()
+        # Cheap byte-level prefilter, only parse files that mention both keys
+        if b'"ring_config"' not in data or b'"instances"' not in data:
+            return None
+        config = parse_json_bytes(data)
+        if 'ring_config' in config and 'instances' in config:
+            ring_config = config['ring_config']
+            return {
+                'file': json_file.name,
+                'size': f"{ring_config.get('width', 'N/A')}x{ring_config.get('height', 'N/A')}",
+                'pads': len(config['instances'])
+            }
+    except Exception:
+        pass
+    return None
+
 @tool
 def list_intent_graphs(directory: str = "output") -> str:
     """
@@ -291,52 +437,39 @@ def list_intent_graphs(directory: str = "output") -> str:
         String containing list of intent graph files
     """
     try:
-        dir_path = Path(directory)
-        if not dir_path.exists():
+        dir_path = directory
+        if not os.path.isdir(dir_path):
             # Try alternative locations
             alt_paths = [
-                Path("output/generated"),
-                Path("src/schematic"),
-                Path("output"),
+                "output/generated",
+                "src/schematic",
+                "output",
             ]
             for alt_path in alt_paths:
-                if alt_path.exists():
+                if os.path.isdir(alt_path):
                     dir_path = alt_path
                     break
             else:
                 return f"❌ Error: Directory {directory} does not exist. Tried: {directory}, output/generated, src/schematic, output"
         
-        # Collect all JSON files
-        json_files = list(dir_path.glob("*.json"))
+        # Collect all JSON files (scandir entries carry cached name/type info)
+        with os.scandir(dir_path) as entries:
+            json_files = [entry for entry in entries if entry.is_file() and entry.name.endswith('.json')]
         
         if not json_files:
             return f"No JSON files found in directory {directory}"
         
-        # Filter files that might be intent graphs
-        intent_graphs = []
-        for json_file in json_files:
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    if 'ring_config' in config and 'instances' in config:
-                        ring_config = config['ring_config']
-                        instances = config['instances']
-                        intent_graphs.append({
-                            'file': json_file.name,
-                            'size': f"{ring_config.get('width', 'N/A')}x{ring_config.get('height', 'N/A')}",
-                            'pads': len(instances)
-                        })
-            except:
-                continue
+        # Filter files that might be intent graphs (I/O bound, so scan in parallel)
+        with ThreadPoolExecutor(max_workers=min(8, len(json_files))) as executor:
+            intent_graphs = [info for info in executor.map(_inspect_intent_file, json_files) if info]
         
         if not intent_graphs:
             return f"No valid intent graph files found in directory {directory}"
         
-        result = f"Found the following intent graph files in directory {directory}:\n"
-        for config in intent_graphs:
-            result += f"  - {config['file']}: {config['size']} scale, {config['pads']} pads\n"
+        lines = [f"Found the following intent graph files in directory {directory}:"]
+        lines.extend(f"  - {config['file']}: {config['size']} scale, {config['pads']} pads" for config in intent_graphs)
         
-        return result
+        return "\n".join(lines) + "\n"
         
     except Exception as e:
         return f"❌ Error occurred while listing intent graph files: {e}"
@@ -357,27 +490,24 @@ def visualize_io_ring_layout(il_file_path: str, output_file_path: Optional[str]
         String description of visualization result, including file path
     """
     try:
-        il_path = Path(il_file_path)
-        if not il_path.exists():
+        if not os.path.isfile(il_file_path):
             return f"❌ Error: Layout file {il_file_path} does not exist"
         
-        if il_path.suffix.lower() != '.il':
+        if os.path.splitext(il_file_path)[1] not in _IL_EXTS:
             return f"❌ Error: File {il_file_path} is not a valid SKILL layout file (.il)"
         
         # Process output file path
         if output_file_path is None:
-            output_path = il_path.parent / f"{il_path.stem}_visualization.png"
+            output_path = _sibling_path(il_file_path, "_visualization.png")
         else:
-            output_path = Path(output_file_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            if output_path.suffix.lower() != '.png':
-                output_path = output_path.with_suffix('.png')
+            output_path = _ensure_ext(output_file_path, '.png', _PNG_EXTS)
+            _ensure_dir(os.path.dirname(output_path))
         
         # Try to detect process node from file content or use default
         # For now, try 180nm first, then fallback to 28nm
         process_node = "T28"  # Default
         try:
-            with open(il_path, 'r', encoding='utf-8') as f:
+            with open(il_file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
                 # Check for 180nm indicators
                 if 'tpd018bcdnv5' in content or 'PAD70LU_TRL' in content:
@@ -388,9 +518,9 @@ def visualize_io_ring_layout(il_file_path: str, output_file_path: Optional[str]
         # Generate visualization (use process-node-specific visualizer)
         try:
             if process_node == "T180":
-                result_path = visualize_layout_T180(str(il_path), str(output_path))
+                result_path = _render_visualization(visualize_layout_T180, il_file_path, output_path)
             else:
-                result_path = visualize_layout(str(il_path), str(output_path))
+                result_path = _render_visualization(visualize_layout, il_file_path, output_path)
             return f"✅ Visualization generated successfully!\n📁 Output file: {result_path}\n\n" \
                    f"The visualization shows the IO ring layout with:\n" \
                    f"  - Colored rectangles representing different device types\n" \
@@ -420,25 +550,21 @@ def visualize_io_ring_from_json(config_file_path: str, output_file_path: Optiona
     """
     try:
         # Check if intent graph file exists
-        config_path = Path(config_file_path)
-        if not config_path.exists():
+        if not os.path.isfile(config_file_path):
             return f"❌ Error: Intent graph file {config_file_path} does not exist"
         
         # Check file extension
-        if config_path.suffix.lower() != '.json':
-            return f"❌ Error: File {config_path} is not a valid JSON file"
+        if os.path.splitext(config_file_path)[1] not in _JSON_EXTS:
+            return f"❌ Error: File {config_file_path} is not a valid JSON file"
         
-        # Load configuration
+        # Load and validate intent graph (cached per file version, shared between tools)
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-        except json.JSONDecodeError as e:
+            is_valid, _, config = _validate_cached(config_file_path)
+        except JSON_DECODE_ERRORS as e:
             return f"❌ Error: JSON format error {e}"
         except Exception as e:
             return f"❌ Error: Failed to load intent graph file {e}"
-        
-        # Validate intent graph
-        if not validate_config(config):
+        if not is_valid:
             return "❌ Error: Intent graph validation failed"
         
         # Get instances and ring_config
@@ -454,76 +580,64 @@ def visualize_io_ring_from_json(config_file_path: str, output_file_path: Optiona
         if "cell_name" in config and "cell_name" not in ring_config:
             ring_config["cell_name"] = config["cell_name"]
         
-        # Initialize layout generator using factory
-        generator = create_layout_generator(process_node)
-        generator.set_config(ring_config)
-        
         # Set defaults if not provided
-        if "pad_width" not in ring_config:
-            ring_config["pad_width"] = generator.config["pad_width"]
-        if "pad_height" not in ring_config:
-            ring_config["pad_height"] = generator.config["pad_height"]
-        if "corner_size" not in ring_config:
-            ring_config["corner_size"] = generator.config["corner_size"]
-        if "pad_spacing" not in ring_config:
-            ring_config["pad_spacing"] = generator.config["pad_spacing"]
-        if "library_name" not in ring_config:
-            ring_config["library_name"] = generator.config["library_name"]
-        if "view_name" not in ring_config:
-            ring_config["view_name"] = generator.config["view_name"]
-        
-        # Convert relative positions to absolute positions
-        if any("position" in instance and "_" in str(instance["position"]) for instance in instances):
-            instances = generator.convert_relative_to_absolute(instances, ring_config)
+        layout_defaults = _layout_defaults(process_node)
+        for key in _RING_CONFIG_DEFAULT_KEYS:
+            ring_config.setdefault(key, layout_defaults[key])
         
-        # Separate components
-        outer_pads = []
-        inner_pads = []
-        corners = []
+        # Layout generator is only needed for position conversion and filler insertion
+        generator = None
         
+        # Convert relative positions (e.g. "top_3") to absolute positions,
+        # stopping at the first relative one found
+        has_relative = False
         for instance in instances:
-            if instance.get("type") == "inner_pad":
-                inner_pads.append(instance)
-            elif instance.get("type") == "pad":
+            position = instance.get("position")
+            if isinstance(position, str) and "_" in position:
+                has_relative = True
+                break
+        if has_relative:
+            generator = _create_configured_generator(process_node, ring_config)
+            instances = generator.convert_relative_to_absolute(instances, ring_config)
+        
+        # Separate components in a single pass over the instances
+        outer_pads, inner_pads, corners, fillers, separators = [], [], [], [], []
+        for instance in instances:
+            type_code = _TYPE_CODE.get(instance.get("type"), _TYPE_OTHER)
+            device = instance.get("device", "")
+            if type_code == _TYPE_PAD:
                 outer_pads.append(instance)
-            elif instance.get("type") == "corner":
+            elif type_code == _TYPE_INNER_PAD:
+                inner_pads.append(instance)
+            elif type_code == _TYPE_CORNER:
                 corners.append(instance)
-        
-        # Check if filler components are already present
-        all_instances = instances
-        existing_fillers = [comp for comp in all_instances if comp.get("type") == "filler" or DeviceClassifier.is_filler_device(comp.get("device", ""))]
-        existing_separators = [comp for comp in all_instances if comp.get("type") == "separator" or DeviceClassifier.is_separator_device(comp.get("device", ""))]
-        
-        if existing_fillers or existing_separators:
-            # Use existing fillers from JSON
-            validation_components = outer_pads + corners
-            all_components_with_fillers = validation_components
-            # Add existing fillers and separators
-            for comp in all_instances:
-                if comp.get("type") == "filler" or DeviceClassifier.is_filler_device(comp.get("device", "")):
-                    all_components_with_fillers.append(comp)
-                elif comp.get("type") == "separator" or DeviceClassifier.is_separator_device(comp.get("device", "")):
-                    all_components_with_fillers.append(comp)
+            if type_code == _TYPE_FILLER or _is_filler(device):
+                fillers.append(instance)
+            elif type_code == _TYPE_SEPARATOR or _is_separator(device):
+                separators.append(instance)
+        
+        # Merge components (inner pads last) with a single copy
+        if fillers or separators:
+            # Use existing fillers and separators from JSON
+            all_components_with_fillers = list(itertools.chain(outer_pads, corners, fillers, separators, inner_pads))
         else:
             # Auto-generate fillers
+            if generator is None:
+                generator = _create_configured_generator(process_node, ring_config)
             validation_components = outer_pads + corners
-            all_components_with_fillers = generator.auto_filler_generator.auto_insert_fillers_with_inner_pads(validation_components, inner_pads)
-        
-        # Add inner pads to components list
-        all_components_with_fillers.extend(inner_pads)
+            components_with_fillers = generator.auto_filler_generator.auto_insert_fillers_with_inner_pads(validation_components, inner_pads)
+            all_components_with_fillers = list(itertools.chain(components_with_fillers, inner_pads))
         
         # Process output file path
         if output_file_path is None:
-            output_path = config_path.parent / f"{config_path.stem}_visualization.png"
+            output_path = _sibling_path(config_file_path, "_visualization.png")
         else:
-            output_path = Path(output_file_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            if output_path.suffix.lower() != '.png':
-                output_path = output_path.with_suffix('.png')
+            output_path = _ensure_ext(output_file_path, '.png', _PNG_EXTS)
+            _ensure_dir(os.path.dirname(output_path))
         
         # Generate visualization directly from components
         try:
-            result_path = visualize_layout_from_components(all_components_with_fillers, str(output_path))
+            result_path = _render_visualization(visualize_layout_from_components, all_components_with_fillers, output_path)
             return f"✅ Visualization generated successfully from JSON!\n📁 Output file: {result_path}\n\n" \
                    f"The visualization shows the IO ring layout with:\n" \
                    f"  - Colored rectangles representing different device types\n" \
@@ -547,34 +661,27 @@ def validate_intent_graph(config_file_path: str) -> str:
         String description of validation result
     """
     try:
-        # Check if intent graph file exists
-        config_path = Path(config_file_path)
-        
-        # Load intent graph
+        # Load and validate intent graph, get statistics (cached per file version, shared between tools)
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-        except json.JSONDecodeError as e:
+            is_valid, stats, _ = _validate_cached(config_file_path)
+        except JSON_DECODE_ERRORS as e:
             return f"❌ JSON format error: {e}"
         except Exception as e:
             return f"❌ Failed to load intent graph file: {e}"
-        
-        # Validate intent graph
-        if not validate_config(config):
+        if not is_valid:
             return "❌ Intent graph validation failed"
         
-        # Get intent graph statistics
-        stats = get_config_statistics(config)
-        
-        result = f"✅ Intent graph file validation passed!\n"
-        result += f"📊 Intent graph statistics:\n"
-        result += f"  - IO ring scale: {stats['ring_size']}\n"
-        result += f"  - Total pad count: {stats['total_pads']}\n"
-        result += f"  - Device types: {stats['device_types']}\n"
+        lines = [
+            "✅ Intent graph file validation passed!",
+            "📊 Intent graph statistics:",
+            f"  - IO ring scale: {stats['ring_size']}",
+            f"  - Total pad count: {stats['total_pads']}",
+            f"  - Device types: {stats['device_types']}",
+        ]
         if stats['digital_ios'] > 0:
-            result += f"  - Digital IOs: {stats['digital_ios']} ({stats['input_ios']} inputs, {stats['output_ios']} outputs)\n"
+            lines.append(f"  - Digital IOs: {stats['digital_ios']} ({stats['input_ios']} inputs, {stats['output_ios']} outputs)")
         
-        return result
+        return "\n".join(lines) + "\n"
         
     except Exception as e:
         return f"❌ Error occurred while validating intent graph file: {e}" 
\ No newline at end of file
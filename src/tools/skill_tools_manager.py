@@ -7,7 +7,7 @@ Dynamic management of SKILL tool scripts
 
 import os
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from smolagents import tool
 from .bridge_utils import rb_exec
 
@@ -15,6 +15,32 @@ from .bridge_utils import rb_exec
 _project_root = Path(__file__).parent.parent.parent
 SKILL_TOOLS_DIR = _project_root / "src" / "skill"
 
+# Rendered list_skill_tools() output keyed on tools directory -> (tool file signature, listing).
+# The signature is the sorted (name, mtime_ns, size) of every .il file, so adding, removing
+# or editing any tool (by whatever means) rebuilds the listing.
+_dir_cache: Dict[str, Tuple[Tuple, str]] = {}
+
+
+# Wrapped SKILL source keyed on tool path -> (mtime_ns, size, wrapped source)
+_script_cache: Dict[str, Tuple[int, int, str]] = {}
+
+
+def _load_wrapped_script(tool_path: Path) -> str:
+    """Return the tool's SKILL code wrapped in progn, re-reading only when the file changed"""
+    key = str(tool_path)
+    st = os.stat(tool_path)
+    cached = _script_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    
+    with open(tool_path, 'r') as f:
+        skill_content = f.read()
+    
+    # Wrap with progn to ensure proper evaluation
+    wrapped_skill = f"(progn\n{skill_content}\n)"
+    _script_cache[key] = (st.st_mtime_ns, st.st_size, wrapped_skill)
+    return wrapped_skill
+
 @tool
 def list_skill_tools() -> str:
     """
@@ -34,12 +60,24 @@ def list_skill_tools() -> str:
         if not SKILL_TOOLS_DIR.exists():
             return "❌ SKILL tools directory does not exist"
         
-        tools = sorted(SKILL_TOOLS_DIR.glob("*.il"))
+        tools = []
+        with os.scandir(SKILL_TOOLS_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".il") and entry.is_file():
+                    st = entry.stat()
+                    tools.append((entry.name, st.st_mtime_ns, st.st_size, entry.path))
         if not tools:
             return "No SKILL tools found"
+        tools.sort()
+        
+        cache_key = str(SKILL_TOOLS_DIR)
+        signature = tuple(tool[:3] for tool in tools)
+        cached = _dir_cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
         
         result = "📦 Available SKILL tools:\n\n"
-        for i, tool_path in enumerate(tools, 1):
+        for i, (tool_name, _, _, tool_path) in enumerate(tools, 1):
             # Read first comment line as description
             try:
                 with open(tool_path, 'r') as f:
@@ -48,9 +86,10 @@ def list_skill_tools() -> str:
             except:
                 desc = "No description"
             
-            result += f"{i}. {tool_path.stem}: {desc}\n"
+            result += f"{i}. {tool_name[:-3]}: {desc}\n"
         
         result += f"\n💡 Use run_skill_tool(tool_name) to execute a tool"
+        _dir_cache[cache_key] = (signature, result)
         return result
         
     except Exception as e:
@@ -79,11 +118,7 @@ def run_skill_tool(tool_name: str) -> str:
             return f"❌ Tool '{tool_name}' not found. Use list_skill_tools() to see available tools."
         
         # Read and execute the tool with progn wrapper to capture return value
-        with open(tool_path, 'r') as f:
-            skill_content = f.read()
-        
-        # Wrap with progn to ensure proper evaluation
-        wrapped_skill = f"(progn\n{skill_content}\n)"
+        wrapped_skill = _load_wrapped_script(tool_path)
         
         # Execute and capture output
         result = rb_exec(wrapped_skill, timeout=30)
@@ -153,6 +188,7 @@ def update_skill_tool(tool_name: str, skill_code: str) -> str:
         # Update the tool
         with open(tool_path, 'w') as f:
             f.write(skill_code)
+        _script_cache.pop(str(tool_path), None)
         
         return f"✅ Tool '{tool_name}' updated successfully!\n💡 The updated version will be used on next run_skill_tool('{tool_name}') call."
         
@@ -178,6 +214,7 @@ def delete_skill_tool(tool_name: str) -> str:
         
         # Delete the tool
         tool_path.unlink()
+        _script_cache.pop(str(tool_path), None)
         
         return f"✅ Tool '{tool_name}' deleted successfully"
         
@@ -7,13 +7,16 @@ Allows AI to modify user preferences across sessions
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from smolagents import tool
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 PROFILE_DIR = PROJECT_ROOT / "user_data"
 PROFILE_DIR.mkdir(exist_ok=True)
 
+# Profile contents keyed on path -> (mtime_ns, size, content), so unchanged profiles are not re-read
+_profile_cache: Dict[str, Tuple[int, int, str]] = {}
+
 
 def get_profile_path(username: Optional[str] = None) -> Path:
     """Get the path to user profile file."""
@@ -58,8 +61,15 @@ def read_profile(username: Optional[str] = None) -> str:
             return ""
     
     try:
+        key = str(profile_path)
+        st = os.stat(profile_path)
+        cached = _profile_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
         with open(profile_path, 'r', encoding='utf-8') as f:
-            return f.read()
+            content = f.read()
+        _profile_cache[key] = (st.st_mtime_ns, st.st_size, content)
+        return content
     except Exception as e:
         print(f"⚠️  Error reading profile file {profile_path}: {e}")
         return ""
@@ -89,6 +99,7 @@ def update_user_profile(new_content: str, username: Optional[str] = None) -> str
         update_user_profile(modified_content)
     """
     profile_path = get_profile_path(username)
+    _profile_cache.pop(str(profile_path), None)
     
     try:
         with open(profile_path, 'w', encoding='utf-8') as f:
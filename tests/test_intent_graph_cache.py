@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test intent graph caching in the IO ring generator tool
+"""
+
+import json
+import shutil
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from src.tools import io_ring_generator_tool
+from src.tools.io_ring_generator_tool import _load_json, _validate_cached, _CONFIG_CACHE_SIZE
+
+SAMPLE_GRAPH = Path(__file__).parent.parent / "user_data" / "io_ring_12x12" / "io_ring_intent_graph.json"
+INVALID_GRAPH = {"ring_config": {"width": 2}, "instances": []}
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache(monkeypatch):
+    """Start every test with an empty intent graph cache"""
+    monkeypatch.setattr(io_ring_generator_tool, "_CONFIG_CACHE", OrderedDict())
+
+
+@pytest.fixture
+def graph_file(tmp_path):
+    """A valid intent graph copied into tmp_path"""
+    path = tmp_path / "intent_graph.json"
+    shutil.copy(SAMPLE_GRAPH, path)
+    return path
+
+
+def test_edited_graph_is_reloaded(graph_file):
+    """Editing a graph is picked up on the next call"""
+    config = _load_json(graph_file)
+    assert "cache_test_marker" not in config["ring_config"]
+
+    config["ring_config"]["cache_test_marker"] = "edited"
+    graph_file.write_text(json.dumps(config), encoding="utf-8")
+
+    assert _load_json(graph_file)["ring_config"]["cache_test_marker"] == "edited"
+
+
+def test_invalid_graph_is_revalidated(tmp_path, monkeypatch):
+    """An invalid graph is re-validated (and its reasons reported) on every call"""
+    calls = []
+    validate = io_ring_generator_tool.validate_config
+    monkeypatch.setattr(io_ring_generator_tool, "validate_config",
+                        lambda config: calls.append(1) or validate(config))
+
+    path = tmp_path / "invalid.json"
+    path.write_text(json.dumps(INVALID_GRAPH), encoding="utf-8")
+
+    for _ in range(2):
+        is_valid, stats, _ = _validate_cached(path)
+        assert not is_valid
+        assert stats is None
+    assert len(calls) == 2
+
+
+def test_valid_graph_is_validated_once(graph_file, monkeypatch):
+    """A valid, unchanged graph reuses its validation result"""
+    calls = []
+    validate = io_ring_generator_tool.validate_config
+    monkeypatch.setattr(io_ring_generator_tool, "validate_config",
+                        lambda config: calls.append(1) or validate(config))
+
+    first = _validate_cached(graph_file)
+    second = _validate_cached(graph_file)
+    assert first[0] and second[0]
+    assert first[1] == second[1]
+    assert len(calls) == 1
+
+
+def test_cache_is_bounded(tmp_path):
+    """The cache never holds more than _CONFIG_CACHE_SIZE graphs"""
+    for i in range(_CONFIG_CACHE_SIZE + 3):
+        path = tmp_path / f"intent_graph_{i}.json"
+        shutil.copy(SAMPLE_GRAPH, path)
+        _validate_cached(path)
+        assert len(io_ring_generator_tool._CONFIG_CACHE) <= _CONFIG_CACHE_SIZE
+    assert len(io_ring_generator_tool._CONFIG_CACHE) == _CONFIG_CACHE_SIZE
+
+
+def test_returned_config_does_not_leak_into_cache(graph_file):
+    """Merging defaults into a returned config doesn't change the cached graph"""
+    for load in (_load_json, lambda path: _validate_cached(path)[2]):
+        config = load(graph_file)
+        config["ring_config"]["pad_width"] = -1
+        config["ring_config"]["cache_test_default"] = True
+        config["cache_test_key"] = True
+
+        reloaded = load(graph_file)
+        assert reloaded["ring_config"].get("pad_width") != -1
+        assert "cache_test_default" not in reloaded["ring_config"]
+        assert "cache_test_key" not in reloaded
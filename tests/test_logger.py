@@ -4,11 +4,6 @@
 Test MinimalOutputLogger directly
 """
 
-from pathlib import Path
-import sys
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
-
 from src.app.utils.custom_logger import MinimalOutputLogger
 
 def test_logger_thought():
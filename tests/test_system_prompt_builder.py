@@ -1,8 +1,3 @@
-from pathlib import Path
-import sys
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
-
 from src.app.utils.system_prompt_builder import load_system_prompt_with_profile
 
 def test_load_system_prompt_with_profile():
@@ -4,24 +4,22 @@
 Test Tool Usage Statistics
 """
 
-import sys
-from pathlib import Path
+from src.app.utils import tool_usage_tracker
+from src.app.utils.tool_usage_tracker import ToolUsageTracker, track_tool_execution
+import itertools
+from types import SimpleNamespace
+import pytest
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
 
-from src.app.utils.tool_usage_tracker import ToolUsageTracker, track_tool_execution
-import time
+@pytest.fixture(scope="module")
+def tracker():
+    """Tracker shared by the tests in this module"""
+    return ToolUsageTracker(stats_file=ToolUsageTracker.MEMORY)
 
 
-def test_basic_tracking():
+def test_basic_tracking(tracker):
     """Test basic tracking functionality"""
-    print("=" * 60)
-    print("Test 1: Basic Tracking")
-    print("=" * 60)
-    
-    tracker = ToolUsageTracker(stats_file="logs/test_tool_stats.json")
+    print(f"{'=' * 60}\nTest 1: Basic Tracking\n{'=' * 60}")
     
     # Simulate some tool calls
     print("\nSimulating tool calls...")
@@ -50,13 +48,9 @@ def test_basic_tracking():
     print("\n✅ Test 1 passed")
 
 
-def test_top_tools():
+def test_top_tools(tracker):
     """Test getting most used tools"""
-    print("\n" + "=" * 60)
-    print("Test 2: Top Tools")
-    print("=" * 60)
-    
-    tracker = ToolUsageTracker(stats_file="logs/test_tool_stats.json")
+    print(f"\n{'=' * 60}\nTest 2: Top Tools\n{'=' * 60}")
     
     # Add some test data first
     tracker.track_call("tool_a", True, 1.0)
@@ -83,13 +77,9 @@ def test_top_tools():
     print("\n✅ Test 2 passed")
 
 
-def test_problematic_tools():
+def test_problematic_tools(tracker):
     """Test problematic tool detection"""
-    print("\n" + "=" * 60)
-    print("Test 3: Problematic Tools")
-    print("=" * 60)
-    
-    tracker = ToolUsageTracker(stats_file="logs/test_tool_stats.json")
+    print(f"\n{'=' * 60}\nTest 3: Problematic Tools\n{'=' * 60}")
     
     problematic = tracker.get_problematic_tools(0.7)
     assert isinstance(problematic, list), "get_problematic_tools should return a list"
@@ -107,13 +97,9 @@ def test_problematic_tools():
     print("\n✅ Test 3 passed")
 
 
-def test_report_generation():
+def test_report_generation(tracker):
     """Test report generation"""
-    print("\n" + "=" * 60)
-    print("Test 4: Report Generation")
-    print("=" * 60)
-    
-    tracker = ToolUsageTracker(stats_file="logs/test_tool_stats.json")
+    print(f"\n{'=' * 60}\nTest 4: Report Generation\n{'=' * 60}")
     
     report = tracker.generate_report()
     assert isinstance(report, str), "generate_report should return a string"
@@ -123,15 +109,17 @@ def test_report_generation():
     print("\n✅ Test 4 passed")
 
 
-def test_decorator():
+def test_decorator(monkeypatch):
     """Test decorator"""
-    print("\n" + "=" * 60)
-    print("Test 5: Decorator")
-    print("=" * 60)
+    print(f"\n{'=' * 60}\nTest 5: Decorator\n{'=' * 60}")
+    
+    # Fake clock advancing 0.1s per reading, and a tracker that never touches disk
+    monkeypatch.setattr(tool_usage_tracker, "time", SimpleNamespace(monotonic=itertools.count(0.0, 0.1).__next__))
+    monkeypatch.setattr(tool_usage_tracker, "_tracker_instance",
+                        ToolUsageTracker(stats_file=ToolUsageTracker.MEMORY))
     
     @track_tool_execution("test_function")
     def test_function(should_fail=False):
-        time.sleep(0.1)
         if should_fail:
             raise ValueError("Test error")
         return "Success"
@@ -151,10 +139,10 @@ def test_decorator():
         print("Caught expected error")
     
     # Check statistics
-    from src.app.utils.tool_usage_tracker import get_tracker
-    tracker = get_tracker()
+    tracker = tool_usage_tracker.get_tracker()
     stats = tracker.get_tool_stats("test_function")
-    assert stats['total_calls'] >= 2, "Should have at least 2 calls"
+    assert stats['total_calls'] == 2, "Should have 2 calls"
+    assert float(stats['avg_execution_time'].rstrip('s')) > 0, "Execution time should come from the clock"
     print(f"\ntest_function statistics:")
     print(f"  Total calls: {stats['total_calls']}")
     print(f"  Success rate: {stats['success_rate']}")
@@ -166,15 +154,15 @@ if __name__ == "__main__":
     print("\n🧪 Testing Tool Usage Statistics\n")
     
     try:
-        test_basic_tracking()
-        test_top_tools()
-        test_problematic_tools()
-        test_report_generation()
-        test_decorator()
+        tracker = ToolUsageTracker(stats_file=ToolUsageTracker.MEMORY)
+        test_basic_tracking(tracker)
+        test_top_tools(tracker)
+        test_problematic_tools(tracker)
+        test_report_generation(tracker)
+        with pytest.MonkeyPatch.context() as mp:
+            test_decorator(mp)
         
-        print("\n" + "=" * 60)
-        print("✅ All tests passed!")
-        print("=" * 60)
+        print(f"\n{'=' * 60}\n✅ All tests passed!\n{'=' * 60}")
         
     except Exception as e:
         print(f"\n❌ Test failed: {e}")
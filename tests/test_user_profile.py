@@ -2,19 +2,24 @@
 # -*- coding: utf-8 -*-
 """Test User Profile Management Tools"""
 
-import sys
-import os
-from pathlib import Path
+import shutil
 
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+import pytest
 
-from src.tools.user_profile_tool import update_user_profile, read_profile
+from src.tools.user_profile_tool import update_user_profile, read_profile, PROFILE_DIR
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _profile_env(tmp_path_factory):
+    """Point the profile tools at a scratch copy of user_data/test_profile.md"""
+    profile_path = tmp_path_factory.mktemp("user_data") / "test_profile.md"
+    shutil.copy(PROFILE_DIR / "test_profile.md", profile_path)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("USER_PROFILE_PATH", str(profile_path))
+        yield profile_path
 
 def test_read_profile():
     """Test reading user profile"""
-    os.environ["USER_PROFILE_PATH"] = "user_data/test_profile.md"
-    
     print("[Test 1]: Read current profile")
     current = read_profile()
     assert isinstance(current, str), "read_profile should return a string"
@@ -22,8 +27,6 @@ def test_read_profile():
 
 def test_update_profile():
     """Test updating user profile"""
-    os.environ["USER_PROFILE_PATH"] = "user_data/test_profile.md"
-    
     print("\n[Test 2]: Create initial profile")
     initial = read_profile()
     modified = initial + "\n- Likes [script_name] in output\n"
@@ -33,8 +36,6 @@ def test_update_profile():
 
 def test_read_updated_profile():
     """Test reading updated profile"""
-    os.environ["USER_PROFILE_PATH"] = "user_data/test_profile.md"
-    
     print("\n[Test 3]: Read again")
     current = read_profile()
     assert isinstance(current, str), "read_profile should return a string"
@@ -42,6 +43,8 @@ def test_read_updated_profile():
     print(current)
 
 if __name__ == "__main__":
+    import os
+    os.environ["USER_PROFILE_PATH"] = "user_data/test_profile.md"
     test_read_profile()
     test_update_profile()
     test_read_updated_profile()